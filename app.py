@@ -1,14 +1,43 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import JSONProvider
+import orjson
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http.cookiejar import DefaultCookiePolicy
 import os
+import logging
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import threading
 import time
+import heapq
+import hashlib
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 load_dotenv('config.env')
 
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
+logger = logging.getLogger(__name__)
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster encoding and decoding"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 PIHOLE_HOST = os.getenv('PIHOLE_HOST', '192.168.1.2')
@@ -17,69 +46,143 @@ MAX_ENTRIES = int(os.getenv('MAX_ENTRIES', '50'))
 REFRESH_INTERVAL = int(os.getenv('REFRESH_INTERVAL', '10'))
 SESSION_REFRESH_MINUTES = int(os.getenv('SESSION_REFRESH_MINUTES', '30'))
 
+# PiHole v6 uses "DENYLIST" and "GRAVITY" statuses for blocked domains
+BLOCKED_STATUSES = ('DENYLIST', 'GRAVITY')
+# Number of queries requested from PiHole per status
+QUERY_FETCH_LENGTH = 500
+
 # PiHole API endpoints
 PIHOLE_BASE_URL = f"http://{PIHOLE_HOST}"
 PIHOLE_API_URL = f"{PIHOLE_BASE_URL}/api"
 PIHOLE_AUTH_URL = f"{PIHOLE_BASE_URL}/api/auth"
 
+# Shared HTTP session so connections to PiHole are kept alive and reused.
+# Connection errors and gateway errors are retried on the pooled connection
+# with jittered exponential backoff.
+retry_policy = Retry(
+    total=2,
+    backoff_factor=0.25,
+    backoff_jitter=0.25,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(['GET', 'POST']),
+    raise_on_status=False
+)
+# Default timeout in seconds for each PiHole API call (applied to connect and read separately)
+PIHOLE_TIMEOUT = 10
+
+http_session = requests.Session()
+http_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry_policy))
+# Authentication is sent explicitly via X-FTL-SID, so don't let the session
+# replay stale sid cookies from earlier logins
+http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+# Precomputed URLs for the API endpoints used on every request
+API_URLS = {
+    endpoint: f"{PIHOLE_API_URL}/{endpoint}"
+    for endpoint in ('queries', 'status', 'domains/allow/exact')
+}
+
+
+def build_headers(sid):
+    """Build request headers authenticating with the given session ID"""
+    return {
+        'X-FTL-SID': sid if sid else '',
+        'Content-Type': 'application/json'
+    }
+
+
 # Session management
 class SessionManager:
     def __init__(self):
         self.session_id = None
         self.session_expiry = None
+        # Request headers for the current session, rebuilt only when the session changes
+        self.headers = build_headers(None)
         self.lock = threading.Lock()
         self.last_error = None
+        # Coordinates threads so only one login request is in flight at a time
+        self.login_condition = threading.Condition()
+        self.login_inflight = False
 
     def login(self):
         """Authenticate with PiHole and get a session ID"""
         try:
-            response = requests.post(
+            response = http_session.post(
                 PIHOLE_AUTH_URL,
                 json={'password': PIHOLE_PASSWORD},
-                timeout=10
+                timeout=PIHOLE_TIMEOUT
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'session' in data and 'sid' in data['session']:
                     with self.lock:
                         self.session_id = data['session']['sid']
+                        self.headers = build_headers(self.session_id)
                         # Set expiry to refresh time
                         self.session_expiry = datetime.now() + timedelta(minutes=SESSION_REFRESH_MINUTES)
                         self.last_error = None
                     return True
 
             # Try to extract from cookies if not in JSON
-            if 'Set-Cookie' in response.headers:
-                cookies = response.headers['Set-Cookie']
-                if 'sid=' in cookies:
-                    sid = cookies.split('sid=')[1].split(';')[0]
-                    # Check if sid is valid (not "deleted" or empty)
-                    if sid and sid != 'deleted':
-                        with self.lock:
-                            self.session_id = sid
-                            self.session_expiry = datetime.now() + timedelta(minutes=SESSION_REFRESH_MINUTES)
-                            self.last_error = None
-                        return True
+            sid = response.cookies.get('sid')
+            # Check if sid is valid (not "deleted" or empty)
+            if sid and sid != 'deleted':
+                with self.lock:
+                    self.session_id = sid
+                    self.headers = build_headers(sid)
+                    self.session_expiry = datetime.now() + timedelta(minutes=SESSION_REFRESH_MINUTES)
+                    self.last_error = None
+                return True
 
             self.last_error = f"Login failed: {response.status_code}"
+            logger.warning("PiHole login failed with status %s", response.status_code)
             return False
 
         except Exception as e:
             self.last_error = f"Login error: {str(e)}"
+            logger.warning("PiHole login error: %s", e)
             return False
 
+    def is_expired(self):
+        """Check if the session is missing, invalid or past its refresh time"""
+        return (not self.session_id or self.session_id == 'deleted'
+                or (self.session_expiry and datetime.now() >= self.session_expiry))
+
+    def refresh(self, force=True):
+        """
+        Log in, coalescing concurrent callers into a single auth request
+
+        Threads that arrive while a login is already in progress wait for its
+        result instead of sending their own. With force=False the login is
+        skipped if another thread has already renewed the session.
+
+        Returns:
+            True if a valid session is available afterwards
+        """
+        with self.login_condition:
+            if self.login_inflight:
+                while self.login_inflight:
+                    if not self.login_condition.wait(timeout=15):
+                        break
+                return self.session_id is not None
+
+            if not force and not self.is_expired():
+                return True
+
+            self.login_inflight = True
+
+        try:
+            return self.login()
+        finally:
+            with self.login_condition:
+                self.login_inflight = False
+                self.login_condition.notify_all()
+
     def get_session_id(self):
         """Get current session ID, refresh if needed"""
-        with self.lock:
-            # Check if session is expired, doesn't exist, or is invalid
-            if not self.session_id or self.session_id == 'deleted' or (self.session_expiry and datetime.now() >= self.session_expiry):
-                # Release lock before calling login (which acquires it)
-                pass
-
-        # Login outside the lock
-        if not self.session_id or self.session_id == 'deleted' or (self.session_expiry and datetime.now() >= self.session_expiry):
-            self.login()
+        if self.is_expired():
+            self.refresh(force=False)
 
         with self.lock:
             return self.session_id
@@ -89,33 +192,103 @@ class SessionManager:
         with self.lock:
             self.session_id = None
             self.session_expiry = None
+            self.headers = build_headers(None)
 
 # Global session manager
 session_manager = SessionManager()
 
+
+class TTLCache:
+    """Small thread-safe in-memory cache whose entries expire after a fixed time"""
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.entries = {}
+        # Bumped by clear(), so values computed before a clear can be rejected
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() < entry[1]:
+                return entry[0]
+            del self.entries[key]
+            return None
+
+    def set(self, key, value, generation=None):
+        """
+        Store value under key for the cache's TTL, dropping any expired entries
+
+        If generation is given and the cache has been cleared since it was read,
+        the value is stale and is not stored.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            expired = [k for k, (_, expiry) in self.entries.items() if expiry <= now]
+            for k in expired:
+                del self.entries[k]
+            self.entries[key] = (value, now + self.ttl)
+
+    def delete(self, key):
+        """Drop the entry for key, if any"""
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """Drop all cached entries and invalidate values computed before now"""
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+
+
+# Blocked list cache, shared by every client polling within one refresh interval
+blocked_cache = TTLCache(ttl=max(1, REFRESH_INTERVAL - 1))
+
+# Upstream fetches currently in progress, so concurrent cache misses share one request
+inflight_requests = {'blocked': None}
+inflight_lock = threading.Lock()
+
+# Worker pool for PiHole updates the UI doesn't need to wait on
+background_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pihole-bg')
+# Most recent background whitelist failures, reported by /api/health
+whitelist_failures = deque(maxlen=20)
+# Whitelist requests from the last few seconds by domain, so double-clicks reuse one request
+recent_whitelists = TTLCache(ttl=5)
+recent_whitelists_lock = threading.Lock()
+
 # Initialize session on startup
 session_manager.login()
 
 
+def schedule_session_refresh():
+    """Schedule the next periodic session refresh on a one-shot timer"""
+    timer = threading.Timer(SESSION_REFRESH_MINUTES * 60, auto_refresh_session)
+    timer.daemon = True
+    timer.start()
+
+
 def auto_refresh_session():
-    """Background thread to refresh session periodically"""
-    while True:
-        time.sleep(SESSION_REFRESH_MINUTES * 60)
-        session_manager.login()
+    """Refresh the session and schedule the next refresh"""
+    try:
+        session_manager.refresh()
+    finally:
+        schedule_session_refresh()
 
 
 # Start background session refresh
-refresh_thread = threading.Thread(target=auto_refresh_session, daemon=True)
-refresh_thread.start()
+schedule_session_refresh()
 
 
 def get_headers():
     """Get headers with session ID for authentication"""
-    sid = session_manager.get_session_id()
-    return {
-        'X-FTL-SID': sid if sid else '',
-        'Content-Type': 'application/json'
-    }
+    if session_manager.is_expired():
+        session_manager.refresh(force=False)
+    return session_manager.headers
 
 
 def make_api_request(method, endpoint, **kwargs):
@@ -128,38 +301,27 @@ def make_api_request(method, endpoint, **kwargs):
         **kwargs: Additional arguments for requests
 
     Returns:
-        Response object or None on failure
+        Response object
     """
-    max_retries = 2
+    headers = get_headers()
+    url = API_URLS.get(endpoint) or f"{PIHOLE_API_URL}/{endpoint}"
+    request_kwargs = {k: v for k, v in kwargs.items() if k != 'timeout'}
+    timeout = kwargs.get('timeout', PIHOLE_TIMEOUT)
 
-    for attempt in range(max_retries):
-        try:
-            headers = get_headers()
-            url = f"{PIHOLE_API_URL}/{endpoint}"
-
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                timeout=kwargs.get('timeout', 10),
-                **{k: v for k, v in kwargs.items() if k != 'timeout'}
-            )
-
-            # If unauthorized, try to refresh session and retry
-            if response.status_code == 401 and attempt < max_retries - 1:
-                session_manager.invalidate()
-                session_manager.login()
-                continue
+    # Transient failures are retried by the session adapter's Retry policy
+    response = http_session.request(method, url, headers=headers, timeout=timeout, **request_kwargs)
 
-            return response
-
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(1)
-                continue
-            raise e
+    # If unauthorized, refresh the session once and retry
+    if response.status_code == 401:
+        # Another thread may already have replaced the rejected session
+        if headers['X-FTL-SID'] == session_manager.session_id:
+            session_manager.invalidate()
+            session_manager.refresh()
+        response.close()
+        response = http_session.request(method, url, headers=get_headers(), timeout=timeout, **request_kwargs)
 
-    return None
+    logger.debug("%s %s -> %s", method.upper(), url, response.status_code)
+    return response
 
 
 @app.route('/')
@@ -170,103 +332,180 @@ def index():
                           refresh_interval=REFRESH_INTERVAL)
 
 
-@app.route('/api/blocked', methods=['GET'])
-def get_blocked_queries():
-    """Get recently blocked queries from PiHole"""
-    try:
-        # PiHole v6 API endpoint for queries
-        # Note: PiHole v6 doesn't support status filtering in params, we filter client-side
-        response = make_api_request(
-            'get',
-            'queries',
-            params={
-                'limit': 500  # Fetch more to ensure we get enough blocked queries
-            }
-        )
-
-        if not response:
-            return jsonify({
-                'success': False,
-                'error': 'Failed to connect to PiHole API'
-            }), 500
-
-        if response.status_code == 200:
-            data = response.json()
-
-            # Process and format the blocked queries
-            # PiHole v6 uses "DENYLIST" and "GRAVITY" statuses for blocked domains
-            blocked_list = []
-            domain_counts = {}
-            blocked_statuses = ['DENYLIST', 'GRAVITY']
-
-            # Count occurrences and get latest timestamp for each domain
-            if 'queries' in data:
-                for query in data['queries']:
-                    # Only process blocked queries (DENYLIST or GRAVITY)
-                    if query.get('status') not in blocked_statuses:
-                        continue
-
-                    domain = query.get('domain', '')
-                    timestamp = query.get('time', 0)
-
-                    if domain:
-                        if domain not in domain_counts:
-                            domain_counts[domain] = {
-                                'count': 0,
-                                'latest_timestamp': timestamp,
-                                'domain': domain
-                            }
-
-                        domain_counts[domain]['count'] += 1
-                        if timestamp > domain_counts[domain]['latest_timestamp']:
-                            domain_counts[domain]['latest_timestamp'] = timestamp
-
-            # Convert to list and sort by latest timestamp
-            blocked_list = sorted(
-                domain_counts.values(),
-                key=lambda x: x['latest_timestamp'],
-                reverse=True
-            )[:MAX_ENTRIES]
+def fetch_blocked_payload():
+    """
+    Fetch recent queries from PiHole and group the blocked ones by domain
 
-            return jsonify({
-                'success': True,
-                'data': blocked_list
-            })
-        else:
-            error_msg = f'PiHole API returned status code {response.status_code}'
-            if session_manager.last_error:
-                error_msg += f' (Auth: {session_manager.last_error})'
+    Returns:
+        Tuple of (response payload dict, HTTP status code)
+    """
+    responses = []
+    try:
+        # PiHole v6 API endpoint for queries, filtered server-side to one status per request.
+        # The API doesn't support column selection, so full rows come back either way.
+        # Bodies are streamed and parsed incrementally below.
+        for status in BLOCKED_STATUSES:
+            response = make_api_request(
+                'get',
+                'queries',
+                params={'length': QUERY_FETCH_LENGTH, 'status': status},
+                stream=True
+            )
 
-            return jsonify({
-                'success': False,
-                'error': error_msg
-            }), response.status_code
+            # Builds that reject the status filter get one unfiltered fetch, filtered below
+            if response.status_code == 400:
+                for rejected, _ in responses + [(response, None)]:
+                    rejected.close()
+                responses = [(make_api_request(
+                    'get',
+                    'queries',
+                    params={'length': QUERY_FETCH_LENGTH},
+                    stream=True
+                ), BLOCKED_STATUSES)]
+                break
+
+            # Remember which status this response was asked for
+            responses.append((response, (status,)))
+
+        for response, _ in responses:
+            if not response:
+                return {
+                    'success': False,
+                    'error': 'Failed to connect to PiHole API'
+                }, 500
+
+            if response.status_code != 200:
+                error_msg = f'PiHole API returned status code {response.status_code}'
+                if session_manager.last_error:
+                    error_msg += f' (Auth: {session_manager.last_error})'
+
+                return {
+                    'success': False,
+                    'error': error_msg
+                }, response.status_code
+
+        # Process and format the blocked queries
+        domain_counts = Counter()
+        latest_timestamps = {}
+
+        # Count occurrences and get latest timestamp for each domain while parsing,
+        # so the full list of queries is never held in memory
+        for response, statuses in responses:
+            response.raw.decode_content = True
+            for query in ijson.items(response.raw, 'queries.item', use_float=True):
+                # Only count rows with the status this response was requested for, so a
+                # server that ignores the filter doesn't get each blocked row counted twice
+                if query.get('status') not in statuses:
+                    continue
+
+                domain = query.get('domain')
+                if not domain:
+                    continue
+
+                domain_counts[domain] += 1
+                timestamp = query.get('time', 0)
+                if timestamp > latest_timestamps.get(domain, -1):
+                    latest_timestamps[domain] = timestamp
+
+        # Keep only the most recently blocked domains
+        latest = heapq.nlargest(MAX_ENTRIES, latest_timestamps.items(), key=lambda item: item[1])
+        blocked_list = [
+            {'domain': domain, 'count': domain_counts[domain], 'latest_timestamp': timestamp}
+            for domain, timestamp in latest
+        ]
+
+        return {
+            'success': True,
+            'data': blocked_list
+        }, 200
 
     except requests.exceptions.RequestException as e:
-        return jsonify({
+        return {
             'success': False,
             'error': f'Failed to connect to PiHole: {str(e)}'
-        }), 500
+        }, 500
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': f'Error processing request: {str(e)}'
-        }), 500
+        }, 500
+    finally:
+        for response, _ in responses:
+            response.close()
 
 
-@app.route('/api/whitelist', methods=['POST'])
-def add_to_whitelist():
-    """Add a domain to the PiHole whitelist"""
-    try:
-        data = request.get_json()
-        domain = data.get('domain', '').strip()
+def blocked_response(body, status_code, etag=None):
+    """
+    Wrap a serialised /api/blocked body, letting browsers reuse successful ones briefly
 
-        if not domain:
+    When an ETag is given and the client already holds that version,
+    an empty 304 Not Modified is returned instead of the body.
+    """
+    response = Response(body, status=status_code, mimetype='application/json')
+    if status_code == 200:
+        response.headers['Cache-Control'] = f'public, max-age={blocked_cache.ttl}'
+    if etag:
+        response.set_etag(etag, weak=True)
+        response = response.make_conditional(request)
+    return response
+
+
+@app.route('/api/blocked', methods=['GET'])
+def get_blocked_queries():
+    """Get recently blocked queries from PiHole"""
+    # The cache holds the serialised response body, so hits skip both PiHole and encoding
+    cached = blocked_cache.get('blocked')
+    if cached is not None:
+        body, etag = cached
+        return blocked_response(body, 200, etag)
+
+    # Only one thread fetches from PiHole on a cache miss; the rest wait for its result
+    with inflight_lock:
+        future = inflight_requests['blocked']
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            inflight_requests['blocked'] = future
+
+    if not is_leader:
+        try:
+            body, status_code, etag = future.result(timeout=15)
+        except FutureTimeoutError:
             return jsonify({
                 'success': False,
-                'error': 'Domain is required'
-            }), 400
+                'error': 'Timed out waiting for PiHole response'
+            }), 504
+        return blocked_response(body, status_code, etag)
+
+    # A whitelist add that finishes while we fetch clears the cache; don't refill it with older data
+    generation = blocked_cache.generation
+
+    try:
+        payload, status_code = fetch_blocked_payload()
+        body = orjson.dumps(payload)
+        etag = None
+        if status_code == 200:
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            blocked_cache.set('blocked', (body, etag), generation=generation)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with inflight_lock:
+            inflight_requests['blocked'] = None
+
+    future.set_result((body, status_code, etag))
+    return blocked_response(body, status_code, etag)
+
 
+def whitelist_domain(domain):
+    """
+    Add a domain to the PiHole allow list (exact match)
+
+    Returns:
+        Tuple of (response payload dict, HTTP status code)
+    """
+    try:
         # PiHole v6 API endpoint for adding to allow list (exact match)
         response = make_api_request(
             'post',
@@ -275,34 +514,105 @@ def add_to_whitelist():
         )
 
         if not response:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'Failed to connect to PiHole API'
-            }), 500
+            }, 500
 
         if response.status_code in [200, 201]:
-            return jsonify({
+            # Newly allowed domain must disappear from the next blocked list
+            blocked_cache.clear()
+            return {
                 'success': True,
                 'message': f'Successfully added {domain} to whitelist'
-            })
+            }, 200
         else:
             error_msg = 'Unknown error'
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg = error_data.get('error', error_msg)
             except:
                 error_msg = response.text or error_msg
 
-            return jsonify({
+            return {
                 'success': False,
                 'error': f'Failed to add to whitelist: {error_msg}'
-            }), response.status_code
+            }, response.status_code
 
     except requests.exceptions.RequestException as e:
-        return jsonify({
+        return {
             'success': False,
             'error': f'Failed to connect to PiHole: {str(e)}'
-        }), 500
+        }, 500
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f'Error processing request: {str(e)}'
+        }, 500
+
+
+def whitelist_in_background(domain):
+    """Add a domain to the whitelist, recording any failure for /api/health"""
+    payload, status_code = whitelist_domain(domain)
+    if not payload['success']:
+        logger.warning("Background whitelist of %s failed: %s", domain, payload['error'])
+        whitelist_failures.append({
+            'domain': domain,
+            'error': payload['error'],
+            'time': time.time()
+        })
+        # Let the user retry straight away instead of reusing the failure
+        with recent_whitelists_lock:
+            recent_whitelists.delete(domain)
+    return payload, status_code
+
+
+def submit_whitelist(domain):
+    """
+    Queue a domain for whitelisting, reusing a request made for it in the last few seconds
+
+    Returns:
+        Future resolving to (response payload dict, HTTP status code)
+    """
+    domain = domain.lower()
+    with recent_whitelists_lock:
+        future = recent_whitelists.get(domain)
+        if future is None:
+            future = background_executor.submit(whitelist_in_background, domain)
+            recent_whitelists.set(domain, future)
+    return future
+
+
+@app.route('/api/whitelist', methods=['POST'])
+def add_to_whitelist():
+    """
+    Add a domain to the PiHole whitelist
+
+    The PiHole request runs in the background and 202 is returned right away.
+    Pass ?wait=1 to wait for PiHole and get its result instead.
+    """
+    try:
+        data = request.get_json()
+        domain = data.get('domain', '').strip()
+
+        if not domain:
+            return jsonify({
+                'success': False,
+                'error': 'Domain is required'
+            }), 400
+
+        future = submit_whitelist(domain)
+
+        if request.args.get('wait') == '1':
+            payload, status_code = future.result()
+            return jsonify(payload), status_code
+
+        return jsonify({
+            'success': True,
+            'message': f'Queued {domain} for whitelisting',
+            'queued_at': time.time()
+        }), 202
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -324,7 +634,8 @@ def health_check():
             'pihole_reachable': pihole_reachable,
             'authenticated': authenticated,
             'pihole_host': PIHOLE_HOST,
-            'auth_error': session_manager.last_error
+            'auth_error': session_manager.last_error,
+            'whitelist_errors': list(whitelist_failures)
         })
     except:
         return jsonify({
@@ -332,9 +643,14 @@ def health_check():
             'pihole_reachable': False,
             'authenticated': False,
             'pihole_host': PIHOLE_HOST,
-            'auth_error': session_manager.last_error
+            'auth_error': session_manager.last_error,
+            'whitelist_errors': list(whitelist_failures)
         })
 
 
+# Development server only. In production run under a threaded WSGI server, e.g.
+#   gunicorn -w 2 -k gthread --threads 8 -b 0.0.0.0:5000 app:app
+#   waitress-serve --threads=8 --listen=0.0.0.0:5000 app:app   (Windows)
+# Shared state (session, caches, in-flight fetches) is guarded by locks for threaded workers.
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
@@ -4,6 +4,11 @@ let persistentDomains = []; // Maintains last 20 domains across refreshes
 let filteredDomains = [];
 let autoRefreshInterval = null;
 let isLoading = false;
+let lastBlockedEtag = null; // ETag of the last blocked list that was rendered
+let pendingWhitelists = new Map(); // Domains queued for whitelisting -> server time they were queued
+
+// Delays (ms) after queueing a whitelist add at which background failures are checked
+const WHITELIST_CHECK_DELAYS = [5000, 30000];
 
 // DOM elements
 const blockedList = document.getElementById('blocked-list');
@@ -70,6 +75,8 @@ async function checkHealth() {
         const response = await fetch('/api/health');
         const data = await response.json();
 
+        reportWhitelistErrors(data.whitelist_errors || []);
+
         if (data.pihole_reachable) {
             updateConnectionStatus('connected', 'Connected to PiHole');
         } else {
@@ -82,6 +89,26 @@ async function checkHealth() {
     }
 }
 
+// Show background failures for domains this page queued for whitelisting
+function reportWhitelistErrors(errors) {
+    let failed = false;
+
+    errors.forEach(item => {
+        const queuedAt = pendingWhitelists.get(item.domain);
+        if (queuedAt !== undefined && item.time >= queuedAt) {
+            pendingWhitelists.delete(item.domain);
+            showToast(`Failed to whitelist ${item.domain}: ${item.error}`, 'error');
+            failed = true;
+        }
+    });
+
+    // The row was removed optimistically; refetch so it comes back and can be retried
+    if (failed) {
+        lastBlockedEtag = null;
+        fetchBlockedDomains(true);
+    }
+}
+
 // Update connection status indicator
 function updateConnectionStatus(status, text) {
     connectionStatus.className = `status-indicator ${status}`;
@@ -89,7 +116,8 @@ function updateConnectionStatus(status, text) {
 }
 
 // Fetch blocked domains from API
-async function fetchBlockedDomains() {
+// Pass revalidate to skip the browser's short-lived cached copy (manual refresh)
+async function fetchBlockedDomains(revalidate = false) {
     if (isLoading) return;
 
     isLoading = true;
@@ -97,10 +125,21 @@ async function fetchBlockedDomains() {
     hideError();
 
     try {
-        const response = await fetch('/api/blocked');
+        const response = await fetch('/api/blocked', { cache: revalidate ? 'no-cache' : 'default' });
+
+        // Same version as last time, nothing to parse or merge; re-render only
+        // so the relative timestamps ("5m ago") keep advancing
+        const etag = response.headers.get('ETag');
+        if (response.ok && etag && etag === lastBlockedEtag) {
+            renderBlockedList();
+            updateConnectionStatus('connected', 'Connected to PiHole');
+            return;
+        }
+
         const result = await response.json();
 
         if (result.success) {
+            lastBlockedEtag = etag;
             blockedDomains = result.data;
 
             // Merge new domains with persistent list
@@ -171,7 +210,7 @@ function handleSearch(e) {
 
 // Handle manual refresh
 function handleRefresh() {
-    fetchBlockedDomains();
+    fetchBlockedDomains(true);
 }
 
 // Handle auto-refresh toggle
@@ -266,7 +305,21 @@ async function addToWhitelist(domain) {
         const result = await response.json();
 
         if (result.success) {
-            showToast(`Successfully whitelisted: ${domain}`, 'success');
+            if (response.status === 202) {
+                // Added in the background; check for a failure once PiHole has had time to answer
+                showToast(`Queued for whitelisting: ${domain}`, 'success');
+                const key = domain.toLowerCase();
+                pendingWhitelists.set(key, result.queued_at);
+                WHITELIST_CHECK_DELAYS.forEach(delay => setTimeout(checkHealth, delay));
+                // Stop watching once the last check has had a chance to report
+                setTimeout(() => {
+                    if (pendingWhitelists.get(key) === result.queued_at) {
+                        pendingWhitelists.delete(key);
+                    }
+                }, Math.max(...WHITELIST_CHECK_DELAYS) + 5000);
+            } else {
+                showToast(`Successfully whitelisted: ${domain}`, 'success');
+            }
 
             // Remove from all lists
             blockedDomains = blockedDomains.filter(item => item.domain !== domain);